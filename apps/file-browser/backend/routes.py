@@ -3,24 +3,29 @@
 Provides:
   GET  /list?path=<rel>&show_hidden=0|1  → directory listing
   GET  /read?path=<rel>                  → file content (text)
-  GET  /download?path=<rel>              → file download
+  GET  /download?path=<rel>              → file download (honours Range)
 """
 from __future__ import annotations
 
+import asyncio
 import mimetypes
 import os
 import stat
 from datetime import datetime, timezone
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import FileResponse, Response
+
 
 router = APIRouter()
 
 # Root path — defaults to home directory
 _root: Path = Path.home()
 
+# /read returns at most this much of a file
+_READ_LIMIT = 512 * 1024
+
 
 def configure(root: str | None = None, **kwargs) -> None:
     """Called by server.py at startup to inject configuration."""
@@ -44,8 +49,8 @@ def _resolve_safe(rel_path: str) -> Path:
     return candidate
 
 
-def _entry_info(p: Path) -> dict:
-    """Build a file entry dict."""
+def _entry_info(p: os.DirEntry) -> dict:
+    """Build a file entry dict from a scandir entry (its stat is cached)."""
     try:
         st = p.stat()
     except OSError:
@@ -66,6 +71,26 @@ def _entry_info(p: Path) -> dict:
     }
 
 
+def _read_head(path: Path, limit: int) -> str:
+    """Read at most limit bytes of path as text, normalising newlines like read_text()."""
+    with open(path, "rb") as f:
+        raw = f.read(limit)
+    return raw.decode("utf-8", errors="replace").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _file_etag(st: os.stat_result) -> str:
+    """Strong ETag from mtime and size; FileResponse checks If-Range against it."""
+    return f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak If-None-Match comparison (RFC 9110), "*" matching any version."""
+    if not if_none_match:
+        return False
+    tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
 def _fmt_size(b: int) -> str:
     if b < 1024:
         return f"{b} B"
@@ -80,7 +105,7 @@ def _fmt_size(b: int) -> str:
 async def list_dir(
     path: str = Query(default=""),
     show_hidden: int = Query(default=0),
-):
+) -> dict:
     """List a directory."""
     resolved = _resolve_safe(path)
 
@@ -90,18 +115,18 @@ async def list_dir(
     if not resolved.is_dir():
         raise HTTPException(400, "Not a directory")
 
+    # scandir gets names and file types in one pass; is_dir() uses d_type and
+    # stat() is cached per entry, so each child costs at most one stat call
     try:
-        children = list(resolved.iterdir())
+        with os.scandir(resolved) as it:
+            children = [e for e in it if show_hidden or not e.name.startswith(".")]
     except PermissionError:
         raise HTTPException(403, "Permission denied")
 
-    entries = []
-    for child in sorted(children, key=lambda p: (not p.is_dir(), p.name.lower())):
-        if child.name in ('.', '..'):
-            continue
-        if not show_hidden and child.name.startswith("."):
-            continue
-        entries.append(_entry_info(child))
+    entries = [
+        _entry_info(child)
+        for child in sorted(children, key=lambda e: (not e.is_dir(), e.name.lower()))
+    ]
 
     # Return full absolute path for display
     return {
@@ -112,7 +137,7 @@ async def list_dir(
 
 
 @router.get("/read")
-async def read_file(path: str = Query(...)):
+async def read_file(path: str = Query(...)) -> dict:
     """Read text file content (first 500KB)."""
     resolved = _resolve_safe(path)
 
@@ -121,14 +146,10 @@ async def read_file(path: str = Query(...)):
     if resolved.is_dir():
         raise HTTPException(400, "Cannot read a directory")
 
-    # Check size
+    # Only the head is ever read, off the event loop — never the whole file
     size = resolved.stat().st_size
-    if size > 512 * 1024:
-        content = resolved.read_bytes()[:512 * 1024].decode("utf-8", errors="replace")
-        truncated = True
-    else:
-        content = resolved.read_text(errors="replace")
-        truncated = False
+    content = await asyncio.to_thread(_read_head, resolved, _READ_LIMIT)
+    truncated = size > _READ_LIMIT
 
     mime, _ = mimetypes.guess_type(resolved.name)
 
@@ -144,8 +165,8 @@ async def read_file(path: str = Query(...)):
 
 
 @router.get("/download")
-async def download(path: str = Query(...)):
-    """Download a file."""
+async def download(request: Request, path: str = Query(...)):
+    """Download a file, or the requested byte range of it."""
     resolved = _resolve_safe(path)
 
     if not resolved.exists():
@@ -155,12 +176,20 @@ async def download(path: str = Query(...)):
 
     mime, _ = mimetypes.guess_type(resolved.name)
     media_type = mime or "application/octet-stream"
+    disposition = f'attachment; filename="{resolved.name}"'
+
+    etag = _file_etag(resolved.stat())
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Accept-Ranges": "bytes"})
 
+    # FileResponse answers Range itself (206, multipart, 416, zero-copy
+    # pathsend where the server supports it) and compares If-Range against
+    # the ETag passed in here
     return FileResponse(
         path=str(resolved),
         filename=resolved.name,
         media_type=media_type,
-        headers={"Content-Disposition": f'attachment; filename="{resolved.name}"'},
+        headers={"Content-Disposition": disposition, "ETag": etag},
     )
 
 
@@ -5,23 +5,32 @@ Mounted at api_prefix: /api/system (see app.json).
 """
 from __future__ import annotations
 
+import asyncio
 import os
 import platform
+import shutil
 import socket
 import subprocess
 import time
 
 from fastapi import APIRouter, HTTPException
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 router = APIRouter()
 
+# Probed once at import — a missing nvidia-smi would otherwise cost a failed
+# exec on every poll
+_NVIDIA_SMI = shutil.which("nvidia-smi")
+
 
 @router.get("/stats")
-async def system_stats():
+async def system_stats() -> dict:
     """Real-time system statistics: CPU, RAM, disk, GPU, uptime."""
-    try:
-        import psutil
-    except ImportError:
+    if psutil is None:
         raise HTTPException(500, "psutil not installed — run install.py")
 
     mem = psutil.virtual_memory()
@@ -37,34 +46,33 @@ async def system_stats():
 
     # GPU — nvidia-smi
     gpu: list[dict] | None = None
-    try:
-        result = subprocess.run(
+    result = None
+    if _NVIDIA_SMI:
+        result = await _run(
             [
-                "nvidia-smi",
+                _NVIDIA_SMI,
                 "--query-gpu=name,utilization.gpu,memory.used,memory.total,"
                 "temperature.gpu,power.draw,power.limit",
                 "--format=csv,noheader,nounits",
             ],
-            capture_output=True, text=True, timeout=5,
+            timeout=5,
         )
-        if result.returncode == 0 and result.stdout.strip():
-            gpu = []
-            for line in result.stdout.strip().splitlines():
-                parts = [p.strip() for p in line.split(",")]
-                if len(parts) >= 7:
-                    def _fv(s: str) -> float | None:
-                        return float(s) if s not in ("[N/A]", "N/A", "") else None
-                    gpu.append({
-                        "name": parts[0],
-                        "utilization_percent": _fv(parts[1]),
-                        "memory_used_mb": _fv(parts[2]),
-                        "memory_total_mb": _fv(parts[3]),
-                        "temperature_c": _fv(parts[4]),
-                        "power_draw_w": _fv(parts[5]),
-                        "power_limit_w": _fv(parts[6]),
-                    })
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
+    if result is not None and result[0] == 0 and result[1].strip():
+        gpu = []
+        for line in result[1].strip().splitlines():
+            parts = [p.strip() for p in line.split(",")]
+            if len(parts) >= 7:
+                def _fv(s: str) -> float | None:
+                    return float(s) if s not in ("[N/A]", "N/A", "") else None
+                gpu.append({
+                    "name": parts[0],
+                    "utilization_percent": _fv(parts[1]),
+                    "memory_used_mb": _fv(parts[2]),
+                    "memory_total_mb": _fv(parts[3]),
+                    "temperature_c": _fv(parts[4]),
+                    "power_draw_w": _fv(parts[5]),
+                    "power_limit_w": _fv(parts[6]),
+                })
 
     # AMD sysfs (always check — may coexist with NVIDIA)
     try:
@@ -79,19 +87,7 @@ async def system_stats():
                 except Exception:
                     return None
 
-            # Read AMD GPU name from sysfs
             amd_name = "AMD GPU"
-            try:
-                result = subprocess.run(
-                    ["lspci", "-s", os.path.basename(
-                        os.path.dirname(os.path.dirname(card_path))
-                    ).split("-", 1)[-1] if "-" in os.path.basename(
-                        os.path.dirname(os.path.dirname(card_path))
-                    ) else "", "-mm"],
-                    capture_output=True, text=True, timeout=3,
-                )
-            except Exception:
-                pass
 
             util = _rsi(card_path)
             vram_used = _rsi(os.path.join(device_dir, "mem_info_vram_used"))
@@ -122,7 +118,7 @@ async def system_stats():
     except Exception:
         pass
 
-    services = _get_service_statuses()
+    services = await _get_service_statuses()
 
     return {
         "hostname": socket.gethostname(),
@@ -154,7 +150,37 @@ async def system_stats():
     }
 
 
-def _get_service_statuses() -> list[dict]:
+# Caps concurrent systemctl/pgrep children across all stats polls
+_PROC_LIMIT = 8
+_proc_sem: asyncio.Semaphore | None = None
+
+
+async def _run(cmd: list[str], timeout: float) -> tuple[int, str] | None:
+    """Run cmd without blocking the event loop. Returns (returncode, stdout) or None on failure."""
+    global _proc_sem
+    if _proc_sem is None:
+        # Created lazily so it binds to the server's running loop
+        _proc_sem = asyncio.Semaphore(_PROC_LIMIT)
+    async with _proc_sem:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL,
+            )
+        except OSError:
+            return None
+        try:
+            out, _ = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass  # exited between the timeout and the kill
+            await proc.wait()
+            return None
+        return proc.returncode, out.decode(errors="replace")
+
+
+async def _get_service_statuses() -> list[dict]:
     """Auto-discover services related to this app, OpenClaw, and crawlers.
 
     Discovery strategy:
@@ -162,6 +188,7 @@ def _get_service_statuses() -> list[dict]:
     2. Scan system units for known patterns (matrix-synapse, openclaw, litellm, ollama)
     3. Detect watchdog-managed processes (litellm, openclaw)
     No hardcoded list — works for any user's setup.
+    Unit and process checks within each step run concurrently.
     """
     if platform.system() != "Linux":
         return []
@@ -172,49 +199,45 @@ def _get_service_statuses() -> list[dict]:
     def _display_name(unit: str) -> str:
         return unit.replace(".service", "").replace(".timer", "")
 
-    def _check_unit(unit: str, scope: str) -> dict | None:
+    async def _check_unit(unit: str, scope: str) -> dict | None:
         cmd = ["systemctl"]
         if scope == "user":
             cmd.append("--user")
         cmd += ["is-active", unit]
-        try:
-            r = subprocess.run(cmd, capture_output=True, text=True, timeout=3)
-            return {
-                "name": _display_name(unit),
-                "unit": unit,
-                "active": r.stdout.strip() == "active",
-                "scope": scope,
-            }
-        except Exception:
+        r = await _run(cmd, timeout=3)
+        if r is None:
+            return None
+        return {
+            "name": _display_name(unit),
+            "unit": unit,
+            "active": r[1].strip() == "active",
+            "scope": scope,
+        }
+
+    async def _check_user_unit(fname: str) -> dict | None:
+        # Skip disabled/masked units (only show enabled or currently active)
+        er = await _run(["systemctl", "--user", "is-enabled", fname], timeout=3)
+        if er is not None and er[1].strip() in ("disabled", "masked"):
             return None
+        return await _check_unit(fname, "user")
 
     # 1. Auto-discover user systemd units
     user_unit_dir = os.path.expanduser("~/.config/systemd/user")
     if os.path.isdir(user_unit_dir):
+        candidates: list[str] = []
         for fname in sorted(os.listdir(user_unit_dir)):
             if not (fname.endswith(".service") or fname.endswith(".timer")):
                 continue
-            # Skip .timer if matching .service already found (avoid duplicates)
-            base = fname.rsplit(".", 1)[0]
-            if fname.endswith(".timer") and base + ".service" in seen:
-                continue
             # For oneshot services with timers, prefer the timer
+            base = fname.rsplit(".", 1)[0]
             if fname.endswith(".service"):
                 timer_path = os.path.join(user_unit_dir, base + ".timer")
                 if os.path.exists(timer_path):
                     continue  # will be picked up as .timer
-            # Skip disabled/masked units (only show enabled or currently active)
-            try:
-                er = subprocess.run(
-                    ["systemctl", "--user", "is-enabled", fname],
-                    capture_output=True, text=True, timeout=3,
-                )
-                state = er.stdout.strip()
-                if state in ("disabled", "masked"):
-                    continue
-            except Exception:
-                pass
-            result = _check_unit(fname, "user")
+            candidates.append(fname)
+
+        results = await asyncio.gather(*(_check_user_unit(f) for f in candidates))
+        for fname, result in zip(candidates, results):
             if result:
                 services.append(result)
                 seen.add(fname)
@@ -222,25 +245,25 @@ def _get_service_statuses() -> list[dict]:
     # 2. Auto-discover relevant system services
     #    Scan for common patterns: openclaw, synapse, matrix, litellm, ollama
     SYSTEM_PATTERNS = ["openclaw", "matrix", "synapse", "litellm", "ollama"]
-    try:
-        r = subprocess.run(
-            ["systemctl", "list-unit-files", "--type=service", "--no-legend", "--no-pager"],
-            capture_output=True, text=True, timeout=5,
-        )
-        if r.returncode == 0:
-            for line in r.stdout.strip().splitlines():
-                parts = line.split()
-                if not parts:
-                    continue
-                unit = parts[0]
-                if any(p in unit.lower() for p in SYSTEM_PATTERNS):
-                    if unit not in seen:
-                        result = _check_unit(unit, "system")
-                        if result:
-                            services.append(result)
-                            seen.add(unit)
-    except Exception:
-        pass
+    r = await _run(
+        ["systemctl", "list-unit-files", "--type=service", "--no-legend", "--no-pager"],
+        timeout=5,
+    )
+    if r is not None and r[0] == 0:
+        units: list[str] = []
+        for line in r[1].strip().splitlines():
+            parts = line.split()
+            if not parts:
+                continue
+            unit = parts[0]
+            if any(p in unit.lower() for p in SYSTEM_PATTERNS) and unit not in seen:
+                units.append(unit)
+
+        results = await asyncio.gather(*(_check_unit(u, "system") for u in units))
+        for unit, result in zip(units, results):
+            if result:
+                services.append(result)
+                seen.add(unit)
 
     # 3. Detect watchdog-managed processes (not in systemd)
     #    Common pattern: processes managed by watchdog scripts or nohup
@@ -248,24 +271,20 @@ def _get_service_statuses() -> list[dict]:
         ("litellm", "litellm.*--port"),
         ("privateapp", r"server\.py.*--port"),
     ]
-    for name, pattern in PROCESS_PATTERNS:
-        # Skip if already found via systemd
-        if any(s["name"] == name for s in services):
-            continue
-        try:
-            r = subprocess.run(
-                ["pgrep", "-f", pattern],
-                capture_output=True, text=True, timeout=3,
-            )
-            if r.stdout.strip():  # process found
-                services.append({
-                    "name": name,
-                    "unit": "process",
-                    "active": True,
-                    "scope": "process",
-                })
-        except Exception:
-            pass
+    # Skip if already found via systemd
+    pending = [
+        (name, pattern) for name, pattern in PROCESS_PATTERNS
+        if not any(s["name"] == name for s in services)
+    ]
+    results = await asyncio.gather(*(_run(["pgrep", "-f", pat], timeout=3) for _, pat in pending))
+    for (name, _pat), r in zip(pending, results):
+        if r is not None and r[1].strip():  # process found
+            services.append({
+                "name": name,
+                "unit": "process",
+                "active": True,
+                "scope": "process",
+            })
 
     return services
 
@@ -18,12 +18,15 @@ import json
 import logging
 import sqlite3
 import sys
+import time
 from pathlib import Path
 from typing import NamedTuple
 
 from fastapi import APIRouter
 from fastapi.staticfiles import StaticFiles
 
+from commons.db import get_pooled_connection
+
 log = logging.getLogger("privateapp.loader")
 
 # Default shared apps directory
@@ -58,34 +61,41 @@ def init_settings_db(data_dir: Path) -> None:
     """Initialize the settings DB. Call once at startup."""
     global _SETTINGS_DB
     _SETTINGS_DB = data_dir / "privateapp.db"
-    conn = sqlite3.connect(str(_SETTINGS_DB))
-    conn.execute("""CREATE TABLE IF NOT EXISTS app_state (
-        app_id TEXT PRIMARY KEY,
-        enabled INTEGER NOT NULL DEFAULT 1,
-        updated_at TEXT DEFAULT (datetime('now'))
-    )""")
-    conn.execute("""CREATE TABLE IF NOT EXISTS discovery_paths (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        path TEXT NOT NULL UNIQUE,
-        label TEXT NOT NULL DEFAULT '',
-        enabled INTEGER NOT NULL DEFAULT 1,
-        added_at TEXT DEFAULT (datetime('now'))
-    )""")
-    conn.execute("""CREATE TABLE IF NOT EXISTS preferences (
-        key TEXT PRIMARY KEY,
-        value TEXT
-    )""")
-    conn.commit()
-    conn.close()
+    _prefs_cache["data"] = None
+    conn = _settings_conn()
+    with conn:
+        conn.execute("""CREATE TABLE IF NOT EXISTS app_state (
+            app_id TEXT PRIMARY KEY,
+            enabled INTEGER NOT NULL DEFAULT 1,
+            updated_at TEXT DEFAULT (datetime('now'))
+        )""")
+        conn.execute("""CREATE TABLE IF NOT EXISTS discovery_paths (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            path TEXT NOT NULL UNIQUE,
+            label TEXT NOT NULL DEFAULT '',
+            enabled INTEGER NOT NULL DEFAULT 1,
+            added_at TEXT DEFAULT (datetime('now'))
+        )""")
+        conn.execute("""CREATE TABLE IF NOT EXISTS preferences (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )""")
+    # Plain `PRAGMA optimize` only weighs tables this connection has already
+    # queried, so on a fresh connection it does nothing. Build the stats
+    # outright the first time; after that optimize=0x10002 re-checks every
+    # table (SQLite 3.46+ — older versions rely on the shutdown optimize).
+    has_stats = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='sqlite_stat1'"
+    ).fetchone()
+    conn.execute("PRAGMA optimize=0x10002" if has_stats else "ANALYZE")
 
     # Ensure default local apps dir exists
     DEFAULT_APPS_DIR.mkdir(parents=True, exist_ok=True)
 
 
 def _settings_conn() -> sqlite3.Connection:
-    conn = sqlite3.connect(str(_SETTINGS_DB))
-    conn.row_factory = sqlite3.Row
-    return conn
+    """Shared per-thread connection to the settings DB (never close it)."""
+    return get_pooled_connection(str(_SETTINGS_DB))
 
 
 # ── App state (enable/disable) ───────────────────────────────────────
@@ -93,19 +103,24 @@ def _settings_conn() -> sqlite3.Connection:
 def is_app_enabled(app_id: str, default: bool = True) -> bool:
     conn = _settings_conn()
     row = conn.execute("SELECT enabled FROM app_state WHERE app_id=?", (app_id,)).fetchone()
-    conn.close()
     return bool(row["enabled"]) if row else default
 
 
+def get_app_states() -> dict[str, bool]:
+    """Return {app_id: enabled} for every app with a saved state, in one query."""
+    conn = _settings_conn()
+    rows = conn.execute("SELECT app_id, enabled FROM app_state").fetchall()
+    return {r["app_id"]: bool(r["enabled"]) for r in rows}
+
+
 def set_app_enabled(app_id: str, enabled: bool) -> None:
     conn = _settings_conn()
-    conn.execute(
-        """INSERT INTO app_state (app_id, enabled) VALUES (?, ?)
-           ON CONFLICT(app_id) DO UPDATE SET enabled=excluded.enabled, updated_at=datetime('now')""",
-        (app_id, 1 if enabled else 0),
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute(
+            """INSERT INTO app_state (app_id, enabled) VALUES (?, ?)
+               ON CONFLICT(app_id) DO UPDATE SET enabled=excluded.enabled, updated_at=datetime('now')""",
+            (app_id, 1 if enabled else 0),
+        )
 
 
 # ── Discovery paths ──────────────────────────────────────────────────
@@ -116,7 +131,6 @@ def get_discovery_paths() -> list[dict]:
     rows = conn.execute(
         "SELECT id, path, label, enabled FROM discovery_paths ORDER BY id"
     ).fetchall()
-    conn.close()
     return [
         {
             "id": r["id"],
@@ -134,55 +148,64 @@ def add_discovery_path(path: str, label: str = "") -> dict:
     expanded = str(Path(path).expanduser().resolve())
     conn = _settings_conn()
     try:
-        conn.execute(
-            "INSERT INTO discovery_paths (path, label) VALUES (?, ?)",
-            (expanded, label or Path(expanded).name),
-        )
-        conn.commit()
+        with conn:
+            conn.execute(
+                "INSERT INTO discovery_paths (path, label) VALUES (?, ?)",
+                (expanded, label or Path(expanded).name),
+            )
         row_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
     except sqlite3.IntegrityError:
-        conn.close()
         raise ValueError(f"Path already registered: {expanded}")
-    conn.close()
     Path(expanded).mkdir(parents=True, exist_ok=True)
     return {"id": row_id, "path": expanded, "label": label or Path(expanded).name, "enabled": True}
 
 
 def remove_discovery_path(path_id: int) -> bool:
     conn = _settings_conn()
-    cursor = conn.execute("DELETE FROM discovery_paths WHERE id=?", (path_id,))
-    conn.commit()
-    conn.close()
+    with conn:
+        cursor = conn.execute("DELETE FROM discovery_paths WHERE id=?", (path_id,))
     return cursor.rowcount > 0
 
 
 def toggle_discovery_path(path_id: int, enabled: bool) -> bool:
     conn = _settings_conn()
-    cursor = conn.execute(
-        "UPDATE discovery_paths SET enabled=? WHERE id=?", (1 if enabled else 0, path_id)
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        cursor = conn.execute(
+            "UPDATE discovery_paths SET enabled=? WHERE id=?", (1 if enabled else 0, path_id)
+        )
     return cursor.rowcount > 0
 
 
 # ── Preferences ──────────────────────────────────────────────────────
 
+# All preferences are cached together; set_preference() invalidates, and the
+# TTL bounds staleness if another process edits the DB.
+_PREFS_TTL = 60.0
+_prefs_cache: dict = {"ts": 0.0, "data": None}
+
+
+def _load_preferences() -> dict[str, str]:
+    now = time.monotonic()
+    if _prefs_cache["data"] is None or now - _prefs_cache["ts"] >= _PREFS_TTL:
+        conn = _settings_conn()
+        rows = conn.execute("SELECT key, value FROM preferences").fetchall()
+        _prefs_cache["data"] = {r["key"]: r["value"] for r in rows}
+        _prefs_cache["ts"] = now
+    return _prefs_cache["data"]
+
+
 def get_preference(key: str, default: str = "") -> str:
-    conn = _settings_conn()
-    row = conn.execute("SELECT value FROM preferences WHERE key=?", (key,)).fetchone()
-    conn.close()
-    return row["value"] if row else default
+    return _load_preferences().get(key, default)
 
 
 def set_preference(key: str, value: str) -> None:
     conn = _settings_conn()
-    conn.execute(
-        "INSERT INTO preferences (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
-        (key, value),
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute(
+            "INSERT INTO preferences (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+            (key, value),
+        )
+    _prefs_cache["data"] = None
 
 
 # ── Detection helpers ────────────────────────────────────────────────
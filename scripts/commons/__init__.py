@@ -1,5 +1,11 @@
 """privateapp backend commons — shared Python utilities for apps."""
-from .db import get_connection, ensure_table
+from .db import get_connection, get_pooled_connection, close_pooled_connections, ensure_table
 from .push import PushManager
 
-__all__ = ["get_connection", "ensure_table", "PushManager"]
+__all__ = [
+    "get_connection",
+    "get_pooled_connection",
+    "close_pooled_connections",
+    "ensure_table",
+    "PushManager",
+]
@@ -5,12 +5,25 @@ Usage:
 
     conn = get_connection("~/.local/share/myapp/data.db")
     ensure_table(conn, "CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, name TEXT)")
+
+Request handlers that hit the same DB on every call should use
+get_pooled_connection() instead, which keeps one open connection per thread.
 """
 from __future__ import annotations
 
 import sqlite3
+import threading
 from pathlib import Path
 
+# Per-thread cache of open connections, keyed by resolved DB path
+_local = threading.local()
+
+# Every pooled connection across threads, so shutdown can close them all.
+# Bumping the generation invalidates the per-thread caches.
+_all_conns: list[sqlite3.Connection] = []
+_all_lock = threading.Lock()
+_generation = 0
+
 
 def get_connection(db_path: str) -> sqlite3.Connection:
     """Open (or create) a SQLite database at db_path.
@@ -28,3 +41,59 @@ def ensure_table(conn: sqlite3.Connection, create_sql: str) -> None:
     """Execute a CREATE TABLE IF NOT EXISTS statement and commit."""
     conn.execute(create_sql)
     conn.commit()
+
+
+def get_pooled_connection(db_path: str) -> sqlite3.Connection:
+    """Return this thread's long-lived connection to db_path, opening it on first use.
+
+    The connection is shared by every caller on the thread — do not close it,
+    and wrap writes in `with conn:` so a failed write is rolled back instead
+    of leaking an open transaction to the next caller.
+    The DB is switched to WAL so readers never wait on a writer.
+    """
+    conns: dict[str, sqlite3.Connection] | None = getattr(_local, "conns", None)
+    if conns is None or getattr(_local, "generation", None) != _generation:
+        conns = _local.conns = {}
+        _local.generation = _generation
+
+    # Fast path: keyed by the caller's string, no filesystem calls
+    conn = conns.get(db_path)
+    if conn is not None:
+        return conn
+
+    resolved = Path(db_path).expanduser().resolve()
+    conn = conns.get(str(resolved))
+    if conn is None:
+        resolved.parent.mkdir(parents=True, exist_ok=True)
+        # check_same_thread=False only so close_pooled_connections() can close it
+        conn = sqlite3.connect(str(resolved), timeout=5, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conns[str(resolved)] = conn
+        with _all_lock:
+            _all_conns.append(conn)
+    conns[db_path] = conn
+    return conn
+
+
+def close_pooled_connections() -> None:
+    """Close every pooled connection. Call once at shutdown.
+
+    Each connection first runs PRAGMA optimize, which re-analyzes the tables
+    that connection queried if their statistics look stale. It then
+    checkpoints the WAL back into the main file.
+    """
+    global _generation
+    with _all_lock:
+        conns = list(_all_conns)
+        _all_conns.clear()
+        _generation += 1
+    for conn in conns:
+        try:
+            conn.execute("PRAGMA optimize")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.close()
+        except sqlite3.Error:
+            pass
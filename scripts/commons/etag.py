@@ -0,0 +1,34 @@
+"""ETag helpers for conditional GETs in privateapp and its apps.
+
+Usage:
+    from commons.etag import file_etag, etag_matches
+
+    etag = file_etag(path.stat())
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+"""
+from __future__ import annotations
+
+import os
+
+
+def file_etag(st: os.stat_result, weak: bool = False) -> str:
+    """ETag for a file version, from its mtime and size.
+
+    Pass weak=True when the body may be re-encoded on the way out (e.g. by
+    GZipMiddleware); a strong tag is only valid for byte-identical bodies.
+    """
+    tag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    return f"W/{tag}" if weak else tag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """True if an If-None-Match header value already covers etag.
+
+    Uses the weak comparison RFC 9110 requires for If-None-Match, and
+    treats "*" as matching any current version.
+    """
+    if not if_none_match:
+        return False
+    tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
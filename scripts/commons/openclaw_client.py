@@ -16,14 +16,21 @@ This is a lightweight HTTP client — no OpenClaw SDK required.
 """
 from __future__ import annotations
 
+import asyncio
+import http.client
 import json
 import os
-import urllib.request
-import urllib.error
+import select
+import threading
+import urllib.parse
 import logging
 
 log = logging.getLogger("privateapp.openclaw_client")
 
+# One keep-alive connection per thread and gateway, so repeated alerts skip
+# the TCP (and TLS) handshake
+_local = threading.local()
+
 
 def get_gateway_url() -> str:
     """Get the OpenClaw gateway URL from env var or default."""
@@ -31,6 +38,75 @@ def get_gateway_url() -> str:
     return url.rstrip("/")
 
 
+def _connection(scheme: str, netloc: str, timeout: float) -> http.client.HTTPConnection:
+    conns: dict | None = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get((scheme, netloc))
+    if conn is None:
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = conns[(scheme, netloc)] = cls(netloc, timeout=timeout)
+    else:
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+    return conn
+
+
+def _is_dropped(sock) -> bool:
+    """True if an idle keep-alive socket has been closed by the peer.
+
+    An idle connection should have nothing to read, so readable means EOF
+    (or stray bytes) — either way it must not be reused.
+    """
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+def _post_json(url: str, payload: dict, timeout: float = 10) -> int:
+    """POST payload as JSON over this thread's pooled connection. Returns the HTTP status.
+
+    A POST is not idempotent, so it is only retried when sending it on a
+    reused connection fails — once a response is awaited, a dropped socket
+    may mean the gateway already acted on it.
+    """
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    body = json.dumps(payload).encode()
+    conn = _connection(parts.scheme, parts.netloc, timeout)
+
+    if conn.sock is not None and _is_dropped(conn.sock):
+        conn.close()
+
+    while True:
+        reused = conn.sock is not None
+        try:
+            conn.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+        except (ConnectionError, http.client.HTTPException):
+            conn.close()
+            # Nothing reached the gateway; retry once on a fresh socket
+            if not reused:
+                raise
+            continue
+        except Exception:
+            conn.close()
+            raise
+        break
+
+    try:
+        resp = conn.getresponse()
+        resp.read()
+    except Exception:
+        conn.close()
+        raise
+    if resp.will_close:
+        conn.close()
+    return resp.status
+
+
 async def send_message(
     message: str,
     room: str | None = None,
@@ -46,28 +122,8 @@ async def send_message(
     Returns:
         True if sent successfully.
     """
-    try:
-        gateway = get_gateway_url()
-        url = f"{gateway}/api/v1/message"
-
-        payload: dict = {"message": message}
-        if room:
-            payload["room"] = room
-        if channel:
-            payload["channel"] = channel
-
-        data = json.dumps(payload).encode()
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers={"Content-Type": "application/json"},
-        )
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            return resp.status == 200
-
-    except Exception as e:
-        log.warning(f"OpenClaw message failed: {e}")
-        return False
+    # The HTTP call blocks, so run it off the event loop
+    return await asyncio.to_thread(send_message_sync, message, room, channel)
 
 
 def send_message_sync(
@@ -86,14 +142,10 @@ def send_message_sync(
         if channel:
             payload["channel"] = channel
 
-        data = json.dumps(payload).encode()
-        req = urllib.request.Request(
-            url,
-            data=data,
-            headers={"Content-Type": "application/json"},
-        )
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            return resp.status == 200
+        status = _post_json(url, payload, timeout=10)
+        if status != 200:
+            log.warning(f"OpenClaw message failed: HTTP {status}")
+        return status == 200
 
     except Exception as e:
         log.warning(f"OpenClaw message failed: {e}")
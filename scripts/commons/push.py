@@ -16,6 +16,8 @@ import logging
 import sqlite3
 from pathlib import Path
 
+from .db import get_pooled_connection
+
 log = logging.getLogger("privateapp.push")
 
 
@@ -29,6 +31,7 @@ class PushManager:
         self.private_key_path = self.data_dir / "vapid_private.pem"
         self.public_key_path = self.data_dir / "vapid_public.txt"
         self._db_path = self.data_dir / "privateapp.db"
+        self._schema_ready = False
 
     # ── Public key ─────────────────────────────────────────────────────
 
@@ -41,32 +44,32 @@ class PushManager:
     # ── Subscriptions ───────────────────────────────────────────────────
 
     def _db(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self._db_path))
-        conn.row_factory = sqlite3.Row
-        conn.execute("""CREATE TABLE IF NOT EXISTS subscriptions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            endpoint TEXT UNIQUE NOT NULL,
-            keys_json TEXT NOT NULL,
-            created_at TEXT DEFAULT (datetime('now')),
-            last_used_at TEXT
-        )""")
-        conn.commit()
+        conn = get_pooled_connection(str(self._db_path))
+        if not self._schema_ready:
+            with conn:
+                conn.execute("""CREATE TABLE IF NOT EXISTS subscriptions (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    endpoint TEXT UNIQUE NOT NULL,
+                    keys_json TEXT NOT NULL,
+                    created_at TEXT DEFAULT (datetime('now')),
+                    last_used_at TEXT
+                )""")
+            self._schema_ready = True
         return conn
 
     def subscribe(self, subscription: dict) -> bool:
         """Save or update a push subscription. Returns True on success."""
         try:
             conn = self._db()
-            conn.execute(
-                """INSERT INTO subscriptions (endpoint, keys_json)
-                   VALUES (?, ?)
-                   ON CONFLICT(endpoint) DO UPDATE SET
-                   keys_json=excluded.keys_json,
-                   last_used_at=datetime('now')""",
-                (subscription["endpoint"], json.dumps(subscription.get("keys", {})))
-            )
-            conn.commit()
-            conn.close()
+            with conn:
+                conn.execute(
+                    """INSERT INTO subscriptions (endpoint, keys_json)
+                       VALUES (?, ?)
+                       ON CONFLICT(endpoint) DO UPDATE SET
+                       keys_json=excluded.keys_json,
+                       last_used_at=datetime('now')""",
+                    (subscription["endpoint"], json.dumps(subscription.get("keys", {})))
+                )
             log.info(f"Push subscription saved: {subscription['endpoint'][:60]}...")
             return True
         except Exception as e:
@@ -77,20 +80,33 @@ class PushManager:
         """Remove a push subscription by endpoint."""
         try:
             conn = self._db()
-            conn.execute("DELETE FROM subscriptions WHERE endpoint=?", (endpoint,))
-            conn.commit()
-            conn.close()
+            with conn:
+                conn.execute("DELETE FROM subscriptions WHERE endpoint=?", (endpoint,))
             return True
         except Exception as e:
             log.error(f"Failed to remove subscription: {e}")
             return False
 
+    def unsubscribe_many(self, endpoints: list[str]) -> bool:
+        """Remove several push subscriptions in one transaction."""
+        if not endpoints:
+            return True
+        try:
+            conn = self._db()
+            with conn:
+                conn.executemany(
+                    "DELETE FROM subscriptions WHERE endpoint=?", [(e,) for e in endpoints]
+                )
+            return True
+        except Exception as e:
+            log.error(f"Failed to remove subscriptions: {e}")
+            return False
+
     def get_all_subscriptions(self) -> list[dict]:
         """Return all active push subscriptions."""
         try:
             conn = self._db()
             rows = conn.execute("SELECT endpoint, keys_json FROM subscriptions").fetchall()
-            conn.close()
             return [
                 {"endpoint": r["endpoint"], "keys": json.loads(r["keys_json"])}
                 for r in rows
@@ -147,8 +163,7 @@ class PushManager:
             except Exception as e:
                 log.error(f"Push error: {e}")
 
-        for endpoint in stale:
-            self.unsubscribe(endpoint)
+        self.unsubscribe_many(stale)
 
         log.info(f"Push sent to {sent}/{len(subscriptions)} subscribers")
         return sent
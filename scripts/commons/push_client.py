@@ -15,6 +15,7 @@ The module auto-discovers the push endpoint:
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import urllib.request
@@ -47,26 +48,8 @@ async def send_push(
     Returns:
         True if sent successfully, False otherwise.
     """
-    try:
-        push_url = _get_push_url()
-        payload = {"title": title, "body": body}
-        if url:
-            payload["url"] = url
-        if tag:
-            payload["tag"] = tag
-
-        data = json.dumps(payload).encode()
-        req = urllib.request.Request(
-            push_url,
-            data=data,
-            headers={"Content-Type": "application/json"},
-        )
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            return resp.status == 200
-
-    except Exception as e:
-        log.warning(f"Push notification failed: {e}")
-        return False
+    # The HTTP call blocks, so run it off the event loop
+    return await asyncio.to_thread(send_push_sync, title, body, url, tag)
 
 
 def send_push_sync(
@@ -26,6 +26,7 @@ DEFAULT_CONFIG_PATH = SCRIPTS_DIR / "config.json"
 
 REQUIRED_PACKAGES = [
     "fastapi>=0.100",
+    "starlette>=0.39",
     "uvicorn[standard]>=0.20",
     "psutil>=5.9",
     "pywebpush>=2.0",
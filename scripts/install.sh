@@ -128,6 +128,7 @@ echo "📦 Installing Python dependencies..."
 "$PIP" install -q --upgrade pip
 "$PIP" install -q \
     "fastapi>=0.100" \
+    "starlette>=0.39" \
     "uvicorn[standard]>=0.20" \
     "psutil>=5.9" \
     "pywebpush>=2.0" \
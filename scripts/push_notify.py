@@ -10,6 +10,8 @@ import os
 import sqlite3
 from pathlib import Path
 
+from commons.db import get_pooled_connection
+
 log = logging.getLogger("privateapp.push")
 
 # Paths are resolved at runtime via config; these are defaults overridable by set_config()
@@ -17,6 +19,7 @@ _DATA_DIR: Path | None = None
 _VAPID_EMAIL: str = "admin@localhost"
 _VAPID_PRIVATE_KEY_PATH: Path | None = None
 _SUBSCRIPTIONS_DB_PATH: Path | None = None
+_schema_ready: set[str] = set()
 
 
 def set_config(data_dir: str, vapid_email: str) -> None:
@@ -38,16 +41,17 @@ def get_subscriptions_db_path() -> Path | None:
 def _db() -> sqlite3.Connection:
     if _SUBSCRIPTIONS_DB_PATH is None:
         raise RuntimeError("push_notify not configured — call set_config() first")
-    conn = sqlite3.connect(str(_SUBSCRIPTIONS_DB_PATH))
-    conn.row_factory = sqlite3.Row
-    conn.execute("""CREATE TABLE IF NOT EXISTS subscriptions (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        endpoint TEXT UNIQUE NOT NULL,
-        keys_json TEXT NOT NULL,
-        created_at TEXT DEFAULT (datetime('now')),
-        last_used_at TEXT
-    )""")
-    conn.commit()
+    conn = get_pooled_connection(str(_SUBSCRIPTIONS_DB_PATH))
+    if str(_SUBSCRIPTIONS_DB_PATH) not in _schema_ready:
+        with conn:
+            conn.execute("""CREATE TABLE IF NOT EXISTS subscriptions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                endpoint TEXT UNIQUE NOT NULL,
+                keys_json TEXT NOT NULL,
+                created_at TEXT DEFAULT (datetime('now')),
+                last_used_at TEXT
+            )""")
+        _schema_ready.add(str(_SUBSCRIPTIONS_DB_PATH))
     return conn
 
 
@@ -55,15 +59,14 @@ def save_subscription(subscription: dict) -> bool:
     """Save or update a push subscription."""
     try:
         conn = _db()
-        conn.execute(
-            """INSERT INTO subscriptions (endpoint, keys_json)
-               VALUES (?, ?)
-               ON CONFLICT(endpoint) DO UPDATE SET keys_json=excluded.keys_json,
-               last_used_at=datetime('now')""",
-            (subscription["endpoint"], json.dumps(subscription.get("keys", {})))
-        )
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.execute(
+                """INSERT INTO subscriptions (endpoint, keys_json)
+                   VALUES (?, ?)
+                   ON CONFLICT(endpoint) DO UPDATE SET keys_json=excluded.keys_json,
+                   last_used_at=datetime('now')""",
+                (subscription["endpoint"], json.dumps(subscription.get("keys", {})))
+            )
         log.info(f"Push subscription saved: {subscription['endpoint'][:60]}...")
         return True
     except Exception as e:
@@ -75,21 +78,35 @@ def remove_subscription(endpoint: str) -> bool:
     """Remove a push subscription by endpoint."""
     try:
         conn = _db()
-        conn.execute("DELETE FROM subscriptions WHERE endpoint=?", (endpoint,))
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.execute("DELETE FROM subscriptions WHERE endpoint=?", (endpoint,))
         return True
     except Exception as e:
         log.error(f"Failed to remove subscription: {e}")
         return False
 
 
+def remove_subscriptions(endpoints: list[str]) -> bool:
+    """Remove several push subscriptions in one transaction."""
+    if not endpoints:
+        return True
+    try:
+        conn = _db()
+        with conn:
+            conn.executemany(
+                "DELETE FROM subscriptions WHERE endpoint=?", [(e,) for e in endpoints]
+            )
+        return True
+    except Exception as e:
+        log.error(f"Failed to remove subscriptions: {e}")
+        return False
+
+
 def get_all_subscriptions() -> list[dict]:
     """Return all active push subscriptions."""
     try:
         conn = _db()
         rows = conn.execute("SELECT endpoint, keys_json FROM subscriptions").fetchall()
-        conn.close()
         return [
             {"endpoint": r["endpoint"], "keys": json.loads(r["keys_json"])}
             for r in rows
@@ -154,8 +171,7 @@ def send_push_notification(
         except Exception as e:
             log.error(f"Push error: {e}")
 
-    for endpoint in stale:
-        remove_subscription(endpoint)
+    remove_subscriptions(stale)
 
     log.info(f"Push sent to {sent}/{len(subscriptions)} subscribers")
     return sent
@@ -20,6 +20,8 @@ Development (with Vite hot-reload):
 from __future__ import annotations
 
 import argparse
+import asyncio
+import hashlib
 import importlib.util
 import json
 import logging
@@ -34,7 +36,7 @@ from typing import AsyncGenerator
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response
+from fastapi.responses import FileResponse, HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.gzip import GZipMiddleware
 
@@ -137,6 +139,8 @@ from push_notify import (  # noqa: E402
 push_set_config(str(DATA_DIR), CONFIG["push"]["vapid_email"])
 
 # New PushManager from commons
+from commons.db import close_pooled_connections  # noqa: E402
+from commons.etag import etag_matches, file_etag  # noqa: E402
 from commons.push import PushManager  # noqa: E402
 _push_manager = PushManager(str(DATA_DIR), CONFIG["push"]["vapid_email"])
 
@@ -146,7 +150,7 @@ from app_loader import (  # noqa: E402
     discover_app_dirs,
     AppInfo,
     init_settings_db,
-    is_app_enabled as _is_app_enabled,
+    get_app_states,
     set_app_enabled as _set_app_enabled,
     get_discovery_paths,
     add_discovery_path,
@@ -210,7 +214,8 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         )
 
     yield
-    # Shutdown: nothing to clean up
+    # Shutdown: optimize, checkpoint and close pooled SQLite connections
+    close_pooled_connections()
 
 
 def _configure_file_browser() -> None:
@@ -227,8 +232,24 @@ def _configure_file_browser() -> None:
 
 
 # ── FastAPI app ───────────────────────────────────────────────────────
+class _ShellGZipMiddleware(GZipMiddleware):
+    """GZip everything except app download routes.
+
+    Downloads carry a strong ETag that If-Range is checked against; gzipping
+    the 200 would make that tag name different bytes than a later 206 serves.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"].endswith("/download"):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# JSON routes declare their return type so FastAPI serializes them straight
+# to bytes via Pydantic instead of going through jsonable_encoder + json.dumps
 app = FastAPI(title="privateapp", docs_url=None, redoc_url=None, lifespan=lifespan)
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+app.add_middleware(_ShellGZipMiddleware, minimum_size=1000)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -301,19 +322,20 @@ _configure_file_browser()
 
 
 @app.get("/api/apps")
-async def api_apps():
+async def api_apps() -> dict:
     """List all apps in a flat list with status fields."""
     result = []
+    states = get_app_states()
 
     for a in _all_apps:
         if a.external:
-            is_enabled = a.detected and _is_app_enabled(a.id, default=False)
+            is_enabled = a.detected and states.get(a.id, False)
             if a.detected:
                 status = "active" if is_enabled else "available"
             else:
                 status = "not-installed"
         else:
-            is_enabled = _is_app_enabled(a.id, default=True)
+            is_enabled = states.get(a.id, True)
             status = "active" if is_enabled else "available"
 
         app_dict: dict = {
@@ -346,7 +368,7 @@ async def api_apps():
 
 
 @app.post("/api/apps/{app_id}/enable")
-async def api_app_enable(app_id: str):
+async def api_app_enable(app_id: str) -> dict:
     """Enable an app (show on home screen)."""
     # Verify app exists
     found = next((a for a in _all_apps if a.id == app_id), None)
@@ -359,7 +381,7 @@ async def api_app_enable(app_id: str):
 
 
 @app.post("/api/apps/{app_id}/disable")
-async def api_app_disable(app_id: str):
+async def api_app_disable(app_id: str) -> dict:
     """Disable an app (hide from home screen)."""
     found = next((a for a in _all_apps if a.id == app_id), None)
     if not found:
@@ -369,7 +391,7 @@ async def api_app_disable(app_id: str):
 
 
 @app.get("/api/info")
-async def api_info():
+async def api_info() -> dict:
     """Server info for the Settings page."""
     return {
         "hostname": socket.gethostname(),
@@ -507,7 +529,9 @@ async def push_unsubscribe(request: Request):
 @app.post("/api/push/send")
 async def push_send(request: Request):
     data = await request.json()
-    sent = send_push_notification(
+    # webpush() makes one blocking HTTP request per subscriber
+    sent = await asyncio.to_thread(
+        send_push_notification,
         data.get("title", "Notification"),
         data.get("body", ""),
         url=data.get("url", "/"),
@@ -518,40 +542,70 @@ async def push_send(request: Request):
 
 @app.get("/api/push/test")
 async def push_test():
-    sent = send_push_notification(
-        "Test", "Push notifications are working! 🎉", url="/", tag="test"
+    sent = await asyncio.to_thread(
+        send_push_notification,
+        "Test", "Push notifications are working! 🎉", url="/", tag="test",
     )
     return {"sent": sent, "subscribers": len(get_all_subscriptions())}
 
 
+# ── Conditional GET helpers ──────────────────────────────────────────
+
+def _file_etag(path: Path) -> str:
+    # Weak: these bodies may go out gzipped, so the tag can't promise bytes
+    return file_etag(path.stat(), weak=True)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    return etag_matches(request.headers.get("if-none-match"), etag)
+
+
+def _not_modified(etag: str, headers: dict | None = None) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, **(headers or {})})
+
+
 # ── PWA manifest & service worker ────────────────────────────────────
 
+# Constant, so encode once instead of on every request
+_MANIFEST_JSON = json.dumps({
+    "name": "privateapp",
+    "short_name": "Apps",
+    "description": "Personal app dashboard",
+    "start_url": "/",
+    "display": "standalone",
+    "background_color": "#000000",
+    "theme_color": "#000000",
+    "orientation": "portrait",
+    "icons": [
+        {"src": "/icon-192.png", "sizes": "192x192", "type": "image/png", "purpose": "any maskable"},
+        {"src": "/icon-512.png", "sizes": "512x512", "type": "image/png", "purpose": "any maskable"},
+    ],
+}, separators=(",", ":")).encode()
+_MANIFEST_ETAG = f'W/"{hashlib.sha1(_MANIFEST_JSON).hexdigest()[:16]}"'
+
+
 @app.get("/manifest.json")
-async def manifest():
-    return JSONResponse({
-        "name": "privateapp",
-        "short_name": "Apps",
-        "description": "Personal app dashboard",
-        "start_url": "/",
-        "display": "standalone",
-        "background_color": "#000000",
-        "theme_color": "#000000",
-        "orientation": "portrait",
-        "icons": [
-            {"src": "/icon-192.png", "sizes": "192x192", "type": "image/png", "purpose": "any maskable"},
-            {"src": "/icon-512.png", "sizes": "512x512", "type": "image/png", "purpose": "any maskable"},
-        ],
-    })
+async def manifest(request: Request):
+    if _etag_matches(request, _MANIFEST_ETAG):
+        return _not_modified(_MANIFEST_ETAG)
+    return Response(
+        content=_MANIFEST_JSON, media_type="application/json", headers={"ETag": _MANIFEST_ETAG},
+    )
 
 
 @app.get("/sw.js")
-async def service_worker():
+async def service_worker(request: Request):
     for candidate in [DIST_DIR / "sw.js", REPO_DIR / "frontend" / "public" / "sw.js"]:
         if candidate.exists():
+            # no-cache makes the browser revalidate on every load — answer with 304 when unchanged
+            headers = {"Service-Worker-Allowed": "/", "Cache-Control": "no-cache"}
+            etag = _file_etag(candidate)
+            if _etag_matches(request, etag):
+                return _not_modified(etag, headers)
             return Response(
-                content=candidate.read_text(),
+                content=candidate.read_bytes(),
                 media_type="application/javascript",
-                headers={"Service-Worker-Allowed": "/", "Cache-Control": "no-cache"},
+                headers={**headers, "ETag": etag},
             )
     raise HTTPException(404, "Service worker not found")
 
@@ -575,7 +629,7 @@ async def icon_512():
 # ── SPA catch-all: serve React index.html for all non-API routes ───────
 
 @app.get("/{full_path:path}")
-async def spa_fallback(full_path: str):
+async def spa_fallback(full_path: str, request: Request):
     if full_path.startswith(("api/", "app/")):
         raise HTTPException(404, "Not found")
 
@@ -588,7 +642,10 @@ async def spa_fallback(full_path: str):
     # Everything else → React SPA
     index = DIST_DIR / "index.html"
     if index.exists():
-        return HTMLResponse(index.read_text(), headers={"Cache-Control": "no-cache"})
+        etag = _file_etag(index)
+        if _etag_matches(request, etag):
+            return _not_modified(etag, {"Cache-Control": "no-cache"})
+        return HTMLResponse(index.read_bytes(), headers={"Cache-Control": "no-cache", "ETag": etag})
 
     return HTMLResponse(
         """<!DOCTYPE html><html><head>